@@ -6,8 +6,14 @@ Premium UI/UX Edition
 
 import streamlit as st
 import boto3
+from botocore.config import Config
 import sys
 import os
+import re
+import heapq
+import hashlib
+import threading
+from collections import Counter, OrderedDict, deque
 from pathlib import Path
 from datetime import datetime
 import pandas as pd
@@ -30,15 +36,50 @@ AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
 AWS_REGION = os.getenv("AWS_REGION", "eu-north-1")
 MODEL_ID = os.getenv("MODEL_ID", "amazon.nova-lite-v1:0")
+# "optimized" enables Bedrock latency-optimized inference where the model/region supports it
+BEDROCK_LATENCY = os.getenv("BEDROCK_LATENCY", "standard")
+BEDROCK_MAX_CONNECTIONS = 16
+# Stop on the prompt's structural boundaries so the model does not echo them
+INFERENCE_CONFIG = {"temperature": 0.1, "maxTokens": 400, "stopSequences": ["\n\nQuestion:", "</doc>"]}
+MAX_TOKENS_FLOOR = 200
+MAX_TOKENS_CEILING = 1000
+OUTPUT_TOKEN_HISTORY = 20
+ANSWER_CACHE_SIZE = 512
+# Adds a Bedrock cachePoint after the document prefix (models with prompt caching only)
+BEDROCK_PROMPT_CACHE = os.getenv("BEDROCK_PROMPT_CACHE", "false").lower() == "true"
+
+# Prompt Configuration
+DOC_EXCERPT_CHARS = 500
+SYSTEM_PROMPT = """You are an IT support assistant with access to historical incident data and documentation.
+
+Rules:
+- Use information from the provided documents and historical data
+- Provide step-by-step solutions when applicable
+- Cite source documents and reference historical patterns
+- Mention average resolution times when available
+- If you don't know, say so"""
+
+# Session Configuration
+QUERY_HISTORY_SIZE = 50
+
+# Retrieval Configuration
+TOKEN_PATTERN = re.compile(r"\w+")
 
 # Initialize Bedrock client
 @st.cache_resource
 def get_bedrock_client():
+    """Initialize a thread-safe Bedrock client with a pooled HTTP connection set"""
     return boto3.client(
         'bedrock-runtime',
         region_name=AWS_REGION,
         aws_access_key_id=AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=AWS_SECRET_ACCESS_KEY
+        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+        config=Config(
+            retries={'mode': 'adaptive', 'max_attempts': 3},
+            max_pool_connections=BEDROCK_MAX_CONNECTIONS,
+            connect_timeout=2,
+            read_timeout=30
+        )
     )
 
 # Initialize external data sources
@@ -49,109 +90,370 @@ def get_csv_analyzer():
 
 @st.cache_resource
 def get_github_api():
-    """Initialize GitHub Status API"""
+    """Initialize GitHub Status API (its responses are cached for CACHE_DURATION)"""
     return GitHubStatusAPI()
 
+class AnswerCache:
+    """Thread-safe LRU cache of generated answers"""
+    
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+    
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+@st.cache_resource
+def get_answer_cache():
+    """Initialize answer cache shared across sessions"""
+    return AnswerCache(ANSWER_CACHE_SIZE)
+
+def answer_cache_key(query, context_docs):
+    """Cache key: (normalized query hash, retrieved doc ids and versions, model, temperature)"""
+    query_key = hashlib.sha256(" ".join(query.lower().split()).encode('utf-8')).hexdigest()
+    # Versions change when a file is edited, so answers built on the old text stop matching
+    doc_ids_key = tuple(sorted((doc['type'], doc['filename'], doc['version']) for doc in context_docs))
+    return query_key, doc_ids_key, MODEL_ID, INFERENCE_CONFIG['temperature']
+
+def adaptive_max_tokens(output_tokens):
+    """maxTokens budget of 1.5x the rolling p95 of recent answer lengths"""
+    if len(output_tokens) < 5:
+        return INFERENCE_CONFIG['maxTokens']
+    ordered = sorted(output_tokens)
+    p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+    return max(MAX_TOKENS_FLOOR, min(MAX_TOKENS_CEILING, int(1.5 * p95)))
+
+def tokenize(text):
+    """Split text into lowercase word tokens"""
+    return TOKEN_PATTERN.findall(text.lower())
+
 # Load knowledge base
-@st.cache_data
-def load_knowledge_base():
-    """Load all documents from data folder"""
-    knowledge = []
-    data_dir = Path("data")
-    
-    for folder in ["incidents", "runbooks", "logs"]:
+KB_FOLDERS = ["incidents", "runbooks", "logs"]
+KB_SUFFIXES = ('.txt', '.md')
+
+def _fingerprint(data_dir):
+    """Cheap snapshot of the knowledge base files: (path, mtime_ns, size)"""
+    entries = []
+    for folder in KB_FOLDERS:
         folder_path = data_dir / folder
-        if folder_path.exists():
-            for file in folder_path.glob("*"):
-                if file.is_file() and file.suffix in ['.txt', '.md']:
-                    content = file.read_text(encoding='utf-8')
-                    knowledge.append({
-                        'filename': file.name,
-                        'type': folder,
-                        'content': content
-                    })
-    
-    return knowledge
-
-def simple_search(query, knowledge, top_k=3):
-    """Simple keyword-based search with CSV insights"""
-    query_lower = query.lower()
-    query_words = set(query_lower.split())
-    
-    scored_docs = []
-    for doc in knowledge:
-        content_lower = doc['content'].lower()
-        score = sum(1 for word in query_words if word in content_lower)
-        if score > 0:
-            scored_docs.append((score, doc))
-    
-    scored_docs.sort(reverse=True, key=lambda x: x[0])
-    return [doc for score, doc in scored_docs[:top_k]]
-
-def generate_response(query, context_docs, client, csv_analyzer):
-    """Generate response using AWS Bedrock with CSV insights"""
-    
-    # Get CSV insights for similar incidents
-    csv_insights = csv_analyzer.search_similar_incidents(query)
-    
-    # Build context
-    context = "\n\n".join([
-        f"Document: {doc['filename']} (Type: {doc['type']})\n{doc['content'][:500]}..."
-        for doc in context_docs
-    ])
-    
-    # Add CSV insights to context
-    if csv_insights:
-        csv_context = "\n\nHistorical Incident Data:\n"
-        for insight in csv_insights:
-            csv_context += f"- {insight['incident_type'].replace('_', ' ').title()}: "
-            csv_context += f"{insight['total_occurrences']} occurrences, "
-            csv_context += f"avg resolution time {insight['avg_resolution_hours']}h, "
-            csv_context += f"severity: {insight['severity']}\n"
-        context += csv_context
-    
-    system_prompt = """You are an IT support assistant with access to historical incident data and documentation.
+        if not folder_path.is_dir():
+            continue
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(KB_SUFFIXES):
+                    stat = entry.stat()
+                    entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(entries))
 
-Rules:
-- Use information from the provided context and historical data
-- Provide step-by-step solutions when applicable
-- Cite source documents and reference historical patterns
-- Mention average resolution times when available
-- If you don't know, say so"""
+@st.cache_resource
+def _get_doc_cache():
+    """Decoded file contents keyed by path, shared across reruns"""
+    return {}
+
+@st.cache_data(show_spinner=False)
+def load_knowledge_base(fingerprint):
+    """Load all documents from data folder and build an inverted index"""
+    knowledge = []
+    inverted_index = {}
+    doc_cache = _get_doc_cache()
+    
+    for path, mtime_ns, size in fingerprint:
+        # Only re-read files that changed since the last load
+        cached = doc_cache.get(path)
+        if cached and cached[0] == (mtime_ns, size):
+            content = cached[1]
+        else:
+            content = Path(path).read_text(encoding='utf-8')
+            doc_cache[path] = ((mtime_ns, size), content)
+        
+        tokens = tokenize(content)
+        doc_id = len(knowledge)
+        knowledge.append({
+            'filename': os.path.basename(path),
+            'type': os.path.basename(os.path.dirname(path)),
+            'content': content,
+            'version': (mtime_ns, size)
+        })
+        
+        # term -> {doc_id: length-normalized term frequency}, precomputed so
+        # query-time scoring is a plain sum over posting lists
+        for term, tf in Counter(tokens).items():
+            inverted_index.setdefault(term, {})[doc_id] = tf / len(tokens)
+    
+    # Drop entries for files that no longer exist
+    live_paths = {path for path, _, _ in fingerprint}
+    for path in list(doc_cache):
+        if path not in live_paths:
+            del doc_cache[path]
+    
+    return knowledge, inverted_index
+
+def simple_search(query, knowledge, inverted_index, top_k=3):
+    """Keyword search over the inverted index, scored by length-normalized TF"""
+    scores = Counter()
+    for term in set(tokenize(query)):
+        scores.update(inverted_index.get(term, {}))
+    
+    top = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+    return [knowledge[doc_id] for doc_id, score in top]
+
+def render_bot_message(target, text):
+    """Render an assistant message bubble into a Streamlit container"""
+    target.markdown(f"""
+    <div class="chat-message bot-message">
+        {text}
+    </div>
+    """, unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False)
+def history_html(recent_queries):
+    """Build the session history list for the most recent queries"""
+    return "".join(f"""
+    <div style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.1); font-size: 0.85em;">
+        <span style="color: #6366f1;">{i}.</span> {q[:35]}...
+    </div>
+    """ for i, q in enumerate(reversed(recent_queries), 1))
+
+@st.cache_data(show_spinner=False)
+def insights_html(insights_key):
+    """Build the historical intelligence boxes from (name, occurrences, avg hours, severity, insight) tuples"""
+    return "".join(f"""
+    <div class="insight-box-premium">
+        <h4 style="margin:0; color: #818cf8;">{display_name}</h4>
+        <div style="display: flex; gap: 15px; margin-top: 5px; font-size: 0.9em; color: #cbd5e1;">
+            <span>📊 <b>{occurrences}</b> events</span>
+            <span>⏱️ <b>{avg_hours}h</b> avg resolution</span>
+            <span style="color: {'#f87171' if severity == 'critical' else '#fbbf24'}">
+                ● {severity.upper()}
+            </span>
+        </div>
+        <p style="margin: 5px 0 0 0; font-style: italic; opacity: 0.8;">{insight}</p>
+    </div>
+    """ for display_name, occurrences, avg_hours, severity, insight in insights_key)
+
+def generate_response(query, context_docs, client, csv_insights, placeholder=None, max_tokens=None):
+    """
+    Generate response using AWS Bedrock with CSV insights
+    
+    Tokens are streamed with converse_stream; when a placeholder is given the
+    partial answer is rendered into it as it arrives. Answers are cached by
+    query, retrieved documents and model, so repeats skip Bedrock entirely;
+    answers cut off by the token budget are not cached. max_tokens overrides
+    the default generation budget.
+    
+    Returns:
+        Tuple of (response text, response time in seconds, token usage dict,
+        whether the answer came from the cache)
+    """
+    answer_cache = get_answer_cache()
+    cache_key = answer_cache_key(query, context_docs)
+    cached = answer_cache.get(cache_key)
+    if cached is not None:
+        text, usage = cached
+        return text, 0.0, usage, True
+    
+    # Stable prefix: retrieved documents in canonical order, identical across
+    # requests that retrieve the same documents so the provider can reuse it
+    content = [
+        {"text": f"<doc id=\"{doc['filename']}\" type=\"{doc['type']}\">\n{doc['content'][:DOC_EXCERPT_CHARS]}\n</doc>"}
+        for doc in sorted(context_docs, key=lambda d: d['filename'])
+    ]
+    if content and BEDROCK_PROMPT_CACHE:
+        content.append({"cachePoint": {"type": "default"}})
+    
+    # Volatile suffix: CSV insights and the question itself
+    if csv_insights:
+        csv_context = "Historical Incident Data:\n" + "\n".join(
+            f"- {insight['display_name']}: {insight['total_occurrences']} occurrences, "
+            f"avg resolution time {insight['avg_resolution_hours']}h, severity: {insight['severity']}"
+            for insight in csv_insights
+        )
+        content.append({"text": csv_context})
     
-    user_message = f"""Context:\n{context}\n\nQuestion: {query}\n\nProvide a helpful answer based on the context and historical data above."""
+    content.append({"text": f"Question: {query}\n\nProvide a helpful answer based on the documents and historical data above."})
     
     try:
         import time
         start_time = time.time()
-        response = client.converse(
+        response = client.converse_stream(
             modelId=MODEL_ID,
-            messages=[{"role": "user", "content": [{"text": user_message}]}],
-            system=[{"text": system_prompt}],
-            inferenceConfig={"temperature": 0.1, "maxTokens": 1000}
+            messages=[{"role": "user", "content": content}],
+            system=[{"text": SYSTEM_PROMPT}],
+            inferenceConfig={**INFERENCE_CONFIG, "maxTokens": max_tokens or INFERENCE_CONFIG['maxTokens']},
+            performanceConfig={"latency": BEDROCK_LATENCY}
         )
+        
+        text = ""
+        usage = {}
+        stop_reason = None
+        for event in response['stream']:
+            block_delta = event.get('contentBlockDelta')
+            if block_delta is not None:
+                # Non-text deltas carry nothing to show; skip the re-render
+                piece = block_delta['delta'].get('text')
+                if piece:
+                    text += piece
+                    if placeholder is not None:
+                        render_bot_message(placeholder, text + "▍")
+            elif 'messageStop' in event:
+                stop_reason = event['messageStop'].get('stopReason')
+            elif 'metadata' in event:
+                usage = event['metadata'].get('usage', {})
         response_time = time.time() - start_time
         
-        return response['output']['message']['content'][0]['text'], response_time
+        # A truncated answer would otherwise be replayed for this query
+        if stop_reason != 'max_tokens':
+            answer_cache.put(cache_key, (text, usage))
+        return text, response_time, usage, False
     except Exception as e:
-        return f"Error generating response: {str(e)}", 0
+        return f"Error generating response: {str(e)}", 0, {}, False
 
-# Initialize session state
-if 'query_history' not in st.session_state:
-    st.session_state.query_history = []
-if 'current_tab' not in st.session_state:
-    st.session_state.current_tab = "Chatbot"
+# Analytics charts, cached on their plain-tuple inputs so reruns reuse the built figures
+@st.cache_data(show_spinner=False)
+def incident_type_chart(items):
+    """Donut chart of incident counts from (display name, count) pairs"""
+    fig = px.pie(
+        values=[count for _, count in items],
+        names=[name for name, _ in items],
+        color_discrete_sequence=px.colors.sequential.RdBu,
+        template="plotly_dark",
+        hole=0.4
+    )
+    fig.update_layout(paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)", uirevision='fixed')
+    return fig
 
-# Streamlit UI
-st.set_page_config(
-    page_title="IT Support AI Pro",
-    page_icon="🤖",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+@st.cache_data(show_spinner=False)
+def severity_chart(items):
+    """Bar chart of incident counts from (severity, count) pairs"""
+    colors = {'critical': '#ef4444', 'high': '#f97316', 'medium': '#fbbf24'}
+    severities = [severity for severity, _ in items]
+    fig = px.bar(
+        x=severities,
+        y=[count for _, count in items],
+        labels={'x': 'Severity', 'y': 'Count'},
+        color=severities,
+        color_discrete_map=colors,
+        template="plotly_dark"
+    )
+    fig.update_layout(paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)", uirevision='fixed')
+    return fig
 
-# Premium CSS
-st.markdown("""
+@st.cache_data(show_spinner=False)
+def monthly_trend_chart(rows):
+    """Line chart of incidents per month from (month, count) pairs"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=[month for month, _ in rows],
+        y=[count for _, count in rows],
+        mode='lines+markers',
+        name='Incidents',
+        line=dict(color='#818cf8', width=4, shape='spline'),
+        fill='tozeroy',
+        fillcolor='rgba(99, 102, 241, 0.1)'
+    ))
+    fig.update_layout(
+        template="plotly_dark",
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        xaxis_title=None,
+        yaxis_title=None,
+        hovermode='x unified',
+        uirevision='fixed'
+    )
+    return fig
+
+def glass_card(name):
+    """Bordered container styled as a glass card"""
+    return st.container(border=True, key=f"glass-card-{name}")
+
+def render_analysis(result, knowledge):
+    """
+    Render an analysis result, generating the AI response on first render
+    
+    Args:
+        result: Dict with query, relevant_docs and csv_insights; response fields
+            are filled in after generation so later reruns can reuse them
+    """
+    relevant_docs = result['relevant_docs']
+    csv_insights = result['csv_insights']
+    
+    # Metrics Row
+    m1, m2, m3, m4 = st.columns(4)
+    with m1: st.metric("Docs Retrieved", len(relevant_docs))
+    with m2: st.metric("Historical Matches", len(csv_insights))
+    with m3: st.metric("KB Size", len(knowledge))
+    
+    confidence = min(100, (len(relevant_docs) * 25) + (len(csv_insights) * 15))
+    with m4: 
+        st.metric("Confidence Score", f"{confidence}%", 
+                 delta="High" if confidence > 70 else "Medium")
+    
+    # Results Container
+    with glass_card("results"):
+        
+        # Historical Data
+        if csv_insights:
+            st.markdown("### 📈 Historical Intelligence")
+            insights_key = tuple(
+                (i['display_name'], i['total_occurrences'], i['avg_resolution_hours'], i['severity'], i['insight'])
+                for i in csv_insights
+            )
+            st.markdown(insights_html(insights_key), unsafe_allow_html=True)
+            st.divider()
+
+        # AI Response
+        st.markdown("### 💡 AI Analysis")
+        response_placeholder = st.empty()
+        if 'response' not in result:
+            client = get_bedrock_client()
+            result['response'], result['response_time'], result['usage'], result['cached'] = generate_response(
+                result['query'], relevant_docs, client, csv_insights, placeholder=response_placeholder,
+                max_tokens=adaptive_max_tokens(st.session_state.output_tokens)
+            )
+            # Cache hits replay old usage; only fresh generations feed the budget
+            if not result['cached'] and 'outputTokens' in result['usage']:
+                st.session_state.output_tokens.append(result['usage']['outputTokens'])
+                del st.session_state.output_tokens[:-OUTPUT_TOKEN_HISTORY]
+            result['generated_at'] = datetime.now()
+        render_bot_message(response_placeholder, result['response'])
+        
+        # Metadata Footer
+        col_meta1, col_meta2 = st.columns(2)
+        with col_meta1:
+            usage = result['usage']
+            token_info = f" · {usage['outputTokens']} tokens" if 'outputTokens' in usage else ""
+            if result.get('cached'):
+                st.caption(f"♻️ Served from answer cache · Amazon Nova Lite{token_info}")
+            else:
+                st.caption(f"⚡ Generated in {result['response_time']:.2f}s using Amazon Nova Lite{token_info}")
+        with col_meta2:
+            st.caption(f"📅 {result['generated_at'].strftime('%Y-%m-%d %H:%M:%S')}")
+        
+        # Sources Accordion
+        if relevant_docs:
+            with st.expander("📚 View Source References"):
+                for doc in relevant_docs:
+                    st.markdown(f"**📄 {doc['filename']}** `({doc['type']})`")
+                    st.code(doc['content'][:200] + "...", language="text")
+
+# Static page assets, built once at import instead of inside the tab bodies
+PREMIUM_CSS = """
 <style>
     /* Import fonts */
     @import url('https://fonts.googleapis.com/css2?family=Plus+Jakarta+Sans:wght@400;500;600;700&display=swap');
@@ -176,7 +478,7 @@ st.markdown("""
     }
     
     /* Glassmorphism Cards */
-    .glass-card {
+    div[class*="st-key-glass-card"] {
         background: rgba(255, 255, 255, 0.03);
         backdrop-filter: blur(16px);
         -webkit-backdrop-filter: blur(16px);
@@ -187,7 +489,7 @@ st.markdown("""
         box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
         transition: transform 0.2s ease, box-shadow 0.2s ease;
     }
-    .glass-card:hover {
+    div[class*="st-key-glass-card"]:hover {
         transform: translateY(-2px);
         box-shadow: 0 8px 30px rgba(0, 0, 0, 0.15);
         border-color: rgba(99, 102, 241, 0.3);
@@ -279,7 +581,60 @@ st.markdown("""
     .status-issue { background: rgba(239, 68, 68, 0.2); color: #f87171; }
     
 </style>
-""", unsafe_allow_html=True)
+"""
+
+PROMPT_SUGGESTIONS = [
+    ("🔧 Database", "How do I fix database timeout errors?"),
+    ("🔐 Security", "What causes authentication failures?"),
+    ("💾 Infrastructure", "Steps to resolve disk space issues"),
+    ("⚡ Performance", "How to troubleshoot slow APIs?"),
+]
+SUGGESTIONS_HTML = '<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px;">' + "".join(
+    f'<div style="padding: 10px; background: rgba(255,255,255,0.05); border-radius: 8px;">'
+    f'<strong>{title}</strong><br>{text}</div>'
+    for title, text in PROMPT_SUGGESTIONS
+) + '</div>'
+
+DATA_SOURCES = [
+    ("CSV Archive", "Active", "0ms"),
+    ("GitHub API", "Connected", "120ms"),
+    ("Vector DB", "Ready", "15ms"),
+]
+DATA_SOURCES_TABLE = "\n".join(
+    ["| Source | Status | Latency |", "| --- | --- | --- |"]
+    + [f"| {source} | {status} | {latency} |" for source, status, latency in DATA_SOURCES]
+)
+
+FOOTER_HTML = """
+<div style="text-align: center; color: #64748b; font-size: 0.8em;">
+    C-AIRA Enterprise v2.0 | Advanced RAG Architecture | Powered by AWS Bedrock & Plotly
+</div>
+"""
+
+# Initialize session state
+if 'query_history' not in st.session_state:
+    st.session_state.query_history = deque(maxlen=QUERY_HISTORY_SIZE)
+if 'output_tokens' not in st.session_state:
+    st.session_state.output_tokens = []
+if 'last_result' not in st.session_state:
+    st.session_state.last_result = None
+if 'current_tab' not in st.session_state:
+    st.session_state.current_tab = "Chatbot"
+
+# Streamlit UI
+st.set_page_config(
+    page_title="IT Support AI Pro",
+    page_icon="🤖",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Shared data, resolved once per rerun from the Streamlit caches
+knowledge, inverted_index = load_knowledge_base(_fingerprint(Path("data")))
+csv_analyzer = get_csv_analyzer()
+
+# Premium CSS
+st.markdown(PREMIUM_CSS, unsafe_allow_html=True)
 
 # Application Header
 col_logo, col_title = st.columns([1, 6])
@@ -299,27 +654,11 @@ with tab1:
     col_main, col_side = st.columns([2.5, 1])
     
     with col_main:
-        with st.container():
-            st.markdown('<div class="glass-card">', unsafe_allow_html=True)
+        with glass_card("new-session"):
             st.subheader("Start a New Session")
             
             with st.expander("💡 View Prompt Suggestions", expanded=False):
-                st.markdown("""
-                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px;">
-                    <div style="padding: 10px; background: rgba(255,255,255,0.05); border-radius: 8px;">
-                        <strong>🔧 Database</strong><br>How do I fix database timeout errors?
-                    </div>
-                    <div style="padding: 10px; background: rgba(255,255,255,0.05); border-radius: 8px;">
-                        <strong>🔐 Security</strong><br>What causes authentication failures?
-                    </div>
-                    <div style="padding: 10px; background: rgba(255,255,255,0.05); border-radius: 8px;">
-                        <strong>💾 Infrastructure</strong><br>Steps to resolve disk space issues
-                    </div>
-                    <div style="padding: 10px; background: rgba(255,255,255,0.05); border-radius: 8px;">
-                        <strong>⚡ Performance</strong><br>How to troubleshoot slow APIs?
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(SUGGESTIONS_HTML, unsafe_allow_html=True)
             
             # Query input
             query = st.text_area(
@@ -334,243 +673,132 @@ with tab1:
                 search_button = st.button("🚀 Analyze", type="primary", use_container_width=True)
             with col_clear:
                 clear_button = st.button("❌ Clear", use_container_width=True)
-            
-            st.markdown('</div>', unsafe_allow_html=True)
         
         if clear_button:
+            st.session_state.last_result = None
             st.rerun()
         
         if search_button and query:
             st.session_state.query_history.append(query)
             
             with st.spinner("🔄 Synthesizing data from Knowledge Base, CSV History & Real-time APIs..."):
-                knowledge = load_knowledge_base()
-                csv_analyzer = get_csv_analyzer()
-                
                 # Search
-                relevant_docs = simple_search(query, knowledge, top_k=3)
-                csv_insights = csv_analyzer.search_similar_incidents(query)
-                
-                # Metrics Row
-                m1, m2, m3, m4 = st.columns(4)
-                with m1: st.metric("Docs Retrieved", len(relevant_docs))
-                with m2: st.metric("Historical Matches", len(csv_insights))
-                with m3: st.metric("KB Size", len(knowledge))
-                
-                confidence = min(100, (len(relevant_docs) * 25) + (len(csv_insights) * 15))
-                with m4: 
-                    st.metric("Confidence Score", f"{confidence}%", 
-                             delta="High" if confidence > 70 else "Medium")
-                
-                # Results Container
-                st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-                
-                # Historical Data
-                if csv_insights:
-                    st.markdown("### 📈 Historical Intelligence")
-                    for insight in csv_insights:
-                        st.markdown(f"""
-                        <div class="insight-box-premium">
-                            <h4 style="margin:0; color: #818cf8;">{insight['incident_type'].replace('_', ' ').title()}</h4>
-                            <div style="display: flex; gap: 15px; margin-top: 5px; font-size: 0.9em; color: #cbd5e1;">
-                                <span>📊 <b>{insight['total_occurrences']}</b> events</span>
-                                <span>⏱️ <b>{insight['avg_resolution_hours']}h</b> avg resolution</span>
-                                <span style="color: {'#f87171' if insight['severity']=='critical' else '#fbbf24'}">
-                                    ● {insight['severity'].upper()}
-                                </span>
-                            </div>
-                            <p style="margin: 5px 0 0 0; font-style: italic; opacity: 0.8;">{insight['insight']}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    st.divider()
-
-                # AI Response
-                client = get_bedrock_client()
-                response, response_time = generate_response(query, relevant_docs, client, csv_analyzer)
-                
-                st.markdown("### 💡 AI Analysis")
-                st.markdown(f"""
-                <div class="chat-message bot-message">
-                    {response}
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Metadata Footer
-                col_meta1, col_meta2 = st.columns(2)
-                with col_meta1:
-                    st.caption(f"⚡ Generated in {response_time:.2f}s using Amazon Nova Lite")
-                with col_meta2:
-                    st.caption(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                # Sources Accordion
-                if relevant_docs:
-                    with st.expander("📚 View Source References"):
-                        for doc in relevant_docs:
-                            st.markdown(f"**📄 {doc['filename']}** `({doc['type']})`")
-                            st.code(doc['content'][:200] + "...", language="text")
-                
-                st.markdown('</div>', unsafe_allow_html=True)
+                st.session_state.last_result = {
+                    'query': query,
+                    'relevant_docs': simple_search(query, knowledge, inverted_index, top_k=3),
+                    'csv_insights': csv_analyzer.search_similar_incidents(query)
+                }
+                render_analysis(st.session_state.last_result, knowledge)
+        elif st.session_state.last_result:
+            # Re-render the previous analysis on unrelated reruns without calling Bedrock again
+            render_analysis(st.session_state.last_result, knowledge)
 
     with col_side:
         # Sidebar Panel
-        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-        st.subheader("📊 Live Stats")
-        csv_analyzer = get_csv_analyzer()
+        with glass_card("live-stats"):
+            st.subheader("📊 Live Stats")
+            
+            st.metric("Total Incidents", csv_analyzer.get_total_incidents(), delta="+12%")
+            st.metric("Avg Resolution", f"{csv_analyzer.get_avg_resolution_time()}h", delta="-0.5h", delta_color="inverse")
         
-        st.metric("Total Incidents", csv_analyzer.get_total_incidents(), delta="+12%")
-        st.metric("Avg Resolution", f"{csv_analyzer.get_avg_resolution_time()}h", delta="-0.5h", delta_color="inverse")
-        st.markdown('</div>', unsafe_allow_html=True)
+        with glass_card("session-history"):
+            st.subheader("🕒 Session History")
+            if st.session_state.query_history:
+                st.markdown(history_html(tuple(st.session_state.query_history)[-5:]), unsafe_allow_html=True)
+            else:
+                st.caption("No queries tracked")
+            answer_cache = get_answer_cache()
+            lookups = answer_cache.hits + answer_cache.misses
+            if lookups:
+                st.caption(f"♻️ Answer cache: {answer_cache.hits}/{lookups} hits ({answer_cache.hits / lookups:.0%})")
+
+# ==================== TAB 2: ANALYTICS ====================
+with tab2:
+    with glass_card("command-center"):
+        st.subheader("📊 Analytics Command Center")
         
-        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-        st.subheader("🕒 Session History")
-        if st.session_state.query_history:
-            for i, q in enumerate(reversed(st.session_state.query_history[-5:]), 1):
+        # Insights Row
+        insights = csv_analyzer.get_insights()
+        cols = st.columns(len(insights))
+        for col, insight in zip(cols, insights):
+            with col:
                 st.markdown(f"""
-                <div style="padding: 8px; border-bottom: 1px solid rgba(255,255,255,0.1); font-size: 0.85em;">
-                    <span style="color: #6366f1;">{i}.</span> {q[:35]}...
+                <div style="background: rgba(99, 102, 241, 0.1); border: 1px solid rgba(99, 102, 241, 0.2); padding: 15px; border-radius: 12px; text-align: center;">
+                    {insight}
                 </div>
                 """, unsafe_allow_html=True)
-        else:
-            st.caption("No queries tracked")
-        st.markdown('</div>', unsafe_allow_html=True)
-
-# ==================== TAB 2: ANALYTICS ====================
-with tab2:
-    st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-    st.subheader("📊 Analytics Command Center")
-    csv_analyzer = get_csv_analyzer()
-    
-    # Insights Row
-    insights = csv_analyzer.get_insights()
-    cols = st.columns(len(insights))
-    for col, insight in zip(cols, insights):
-        with col:
-            st.markdown(f"""
-            <div style="background: rgba(99, 102, 241, 0.1); border: 1px solid rgba(99, 102, 241, 0.2); padding: 15px; border-radius: 12px; text-align: center;">
-                {insight}
-            </div>
-            """, unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
     
     # Charts Area
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-        st.subheader("Incidents by Type")
-        incident_by_type = csv_analyzer.get_incident_by_type()
-        if incident_by_type:
-            fig = px.pie(
-                values=list(incident_by_type.values()),
-                names=[k.replace('_', ' ').title() for k in incident_by_type.keys()],
-                color_discrete_sequence=px.colors.sequential.RdBu,
-                template="plotly_dark",
-                hole=0.4
-            )
-            fig.update_layout(paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)")
-            st.plotly_chart(fig, use_container_width=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        with glass_card("incident-types"):
+            st.subheader("Incidents by Type")
+            incident_by_type = csv_analyzer.get_incident_by_type()
+            if incident_by_type:
+                st.plotly_chart(incident_type_chart(tuple(
+                    (csv_analyzer.get_display_name(incident_type), count)
+                    for incident_type, count in sorted(incident_by_type.items())
+                )), use_container_width=True)
     
     with col2:
-        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-        st.subheader("Severity Distribution")
-        severity_dist = csv_analyzer.get_severity_distribution()
-        if severity_dist:
-            colors = {'critical': '#ef4444', 'high': '#f97316', 'medium': '#fbbf24'}
-            fig = px.bar(
-                x=list(severity_dist.keys()),
-                y=list(severity_dist.values()),
-                labels={'x': 'Severity', 'y': 'Count'},
-                color=list(severity_dist.keys()),
-                color_discrete_map=colors,
-                template="plotly_dark"
-            )
-            fig.update_layout(paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)")
-            st.plotly_chart(fig, use_container_width=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        with glass_card("severity"):
+            st.subheader("Severity Distribution")
+            severity_dist = csv_analyzer.get_severity_distribution()
+            if severity_dist:
+                st.plotly_chart(severity_chart(tuple(severity_dist.items())), use_container_width=True)
     
     # Details Table
-    st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-    st.subheader("📅 Monthly Incident Trends")
-    monthly_trends = csv_analyzer.get_monthly_trends()
-    if not monthly_trends.empty:
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=monthly_trends.index,
-            y=monthly_trends['count'],
-            mode='lines+markers',
-            name='Incidents',
-            line=dict(color='#818cf8', width=4, shape='spline'),
-            fill='tozeroy',
-            fillcolor='rgba(99, 102, 241, 0.1)'
-        ))
-        fig.update_layout(
-            template="plotly_dark",
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)",
-            xaxis_title=None,
-            yaxis_title=None,
-            hovermode='x unified'
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    with glass_card("monthly-trends"):
+        st.subheader("📅 Monthly Incident Trends")
+        monthly_trends = csv_analyzer.get_monthly_trends()
+        if not monthly_trends.empty:
+            st.plotly_chart(monthly_trend_chart(tuple(monthly_trends['count'].items())), use_container_width=True)
 
 # ==================== TAB 3: EXTERNAL DATA ====================
 with tab3:
-    st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-    st.subheader("🌐 Operations Control")
-    
-    github_api = get_github_api()
-    status = github_api.get_status()
-    summary = github_api.get_summary()
-    
-    col1, col2 = st.columns([3, 1])
-    
-    with col1:
-        st.markdown(f"### {summary}")
-        if status.get('is_operational'):
-            st.markdown('<span class="status-badge status-operational">● SYSTEMS OPERATIONAL</span>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<span class="status-badge status-issue">● {status.get("description", "Issues Detected").upper()}</span>', unsafe_allow_html=True)
-        st.caption(f"Last updated: {status.get('last_updated', 'Unknown')}")
+    with glass_card("operations"):
+        st.subheader("🌐 Operations Control")
         
-    with col2:
-        if st.button("🔄 Sync Status"):
-            st.cache_resource.clear()
-            st.rerun()
-    st.markdown('</div>', unsafe_allow_html=True)
+        github_api = get_github_api()
+        status = github_api.get_status()
+        summary = github_api.get_summary()
+        
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            st.markdown(f"### {summary}")
+            if status.get('is_operational'):
+                st.markdown('<span class="status-badge status-operational">● SYSTEMS OPERATIONAL</span>', unsafe_allow_html=True)
+            else:
+                st.markdown(f'<span class="status-badge status-issue">● {status.get("description", "Issues Detected").upper()}</span>', unsafe_allow_html=True)
+            st.caption(f"Last updated: {status.get('last_updated', 'Unknown')}")
+            
+        with col2:
+            if st.button("🔄 Sync Status"):
+                github_api.clear_cache()
+                st.rerun()
     
     col_inc, col_info = st.columns([2, 1])
     
     with col_inc:
-        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-        st.subheader("📋 Recent Active Alerts")
-        incidents = github_api.get_recent_incidents(3)
-        if incidents:
-            for incident in incidents:
-                with st.expander(f"{incident['name']} - {incident['status'].upper()}", expanded=True):
-                    st.write(f"**Impact:** {incident['impact']}")
-                    st.write(f"**Created:** {incident['created_at']}")
-                    st.write(f"[View Incident Report]({incident.get('shortlink', '#')})")
-        else:
-            st.info("No active incidents reported in the last 24h")
-        st.markdown('</div>', unsafe_allow_html=True)
+        with glass_card("alerts"):
+            st.subheader("📋 Recent Active Alerts")
+            incidents = github_api.get_recent_incidents(3)
+            if incidents:
+                for incident in incidents:
+                    with st.expander(f"{incident['name']} - {incident['status'].upper()}", expanded=True):
+                        st.write(f"**Impact:** {incident['impact']}")
+                        st.write(f"**Created:** {incident['created_at']}")
+                        st.write(f"[View Incident Report]({incident.get('shortlink', '#')})")
+            else:
+                st.info("No active incidents reported in the last 24h")
         
     with col_info:
-        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-        st.subheader("🔗 Data Sources")
-        data_sources = [
-            {"Source": "CSV Archive", "Status": "Active", "Latency": "0ms"},
-            {"Source": "GitHub API", "Status": "Connected", "Latency": "120ms"},
-            {"Source": "Vector DB", "Status": "Ready", "Latency": "15ms"},
-        ]
-        st.table(data_sources)
-        st.markdown('</div>', unsafe_allow_html=True)
+        with glass_card("data-sources"):
+            st.subheader("🔗 Data Sources")
+            st.markdown(DATA_SOURCES_TABLE)
 
 # Footer
 st.markdown("---")
-st.markdown("""
-<div style="text-align: center; color: #64748b; font-size: 0.8em;">
-    C-AIRA Enterprise v2.0 | Advanced RAG Architecture | Powered by AWS Bedrock & Plotly
-</div>
-""", unsafe_allow_html=True)
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)
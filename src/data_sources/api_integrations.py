@@ -4,8 +4,10 @@ Provides real-time data from public APIs
 """
 
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,14 +24,45 @@ class GitHubStatusAPI:
     
     def __init__(self):
         """Initialize GitHub Status API client"""
-        self._cache = {}
-        self._last_fetch = None
+        # Shared across all endpoints: {path: (payload, fetched_at)}
+        self._endpoint_cache: Dict[str, Tuple[Any, datetime]] = {}
+        self._lock = threading.Lock()
+        
+        # Reuse TCP/TLS connections across requests
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    
+    def clear_cache(self):
+        """Discard cached responses so the next call fetches fresh data"""
+        with self._lock:
+            self._endpoint_cache.clear()
     
-    def _is_cache_valid(self) -> bool:
-        """Check if cached data is still valid"""
-        if self._last_fetch is None:
-            return False
-        return datetime.now() - self._last_fetch < self.CACHE_DURATION
+    def _fetch(self, path: str) -> Tuple[Any, datetime]:
+        """
+        Fetch JSON for an endpoint, served from cache while fresh
+        
+        Args:
+            path: Endpoint path relative to BASE_URL (e.g. "status.json")
+            
+        Returns:
+            Tuple of (parsed JSON payload, time it was fetched)
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        with self._lock:
+            cached = self._endpoint_cache.get(path)
+        if cached is not None and datetime.now() - cached[1] < self.CACHE_DURATION:
+            logger.info(f"Returning cached GitHub {path}")
+            return cached
+        
+        response = self._session.get(f"{self.BASE_URL}/{path}", timeout=5)
+        response.raise_for_status()
+        entry = (response.json(), datetime.now())
+        
+        with self._lock:
+            self._endpoint_cache[path] = entry
+        return entry
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -38,33 +71,18 @@ class GitHubStatusAPI:
         Returns:
             Dictionary with status information
         """
-        # Return cached data if valid
-        if self._is_cache_valid() and self._cache:
-            logger.info("Returning cached GitHub status")
-            return self._cache
-        
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/status.json",
-                timeout=5
-            )
-            response.raise_for_status()
-            
-            data = response.json()
+            data, fetched_at = self._fetch("status.json")
             
             # Parse and format the response
             status_info = {
                 'status': data.get('status', {}).get('indicator', 'unknown'),
                 'description': data.get('status', {}).get('description', 'No description available'),
-                'last_updated': datetime.now().isoformat(),
+                'last_updated': fetched_at.isoformat(),
                 'is_operational': data.get('status', {}).get('indicator') == 'none',
                 'raw_data': data
             }
             
-            # Cache the result
-            self._cache = status_info
-            self._last_fetch = datetime.now()
-            
             logger.info(f"GitHub status fetched: {status_info['status']}")
             return status_info
             
@@ -86,13 +104,7 @@ class GitHubStatusAPI:
             Dictionary with component statuses
         """
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/components.json",
-                timeout=5
-            )
-            response.raise_for_status()
-            
-            data = response.json()
+            data, _ = self._fetch("components.json")
             components = data.get('components', [])
             
             # Format component data
@@ -121,13 +133,7 @@ class GitHubStatusAPI:
             List of recent incidents
         """
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/incidents.json",
-                timeout=5
-            )
-            response.raise_for_status()
-            
-            data = response.json()
+            data, _ = self._fetch("incidents.json")
             incidents = data.get('incidents', [])[:limit]
             
             # Format incident data
@@ -3,17 +3,49 @@ CSV Analyzer for Incident Statistics
 Analyzes incident_stats.csv to provide insights and trends
 """
 
+import re
+import numpy as np
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Iterator, Mapping
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class _LazyChartData(Mapping):
+    """Read-only mapping that builds each chart entry on first access"""
+    
+    def __init__(self, builders: Dict[str, Callable[[], Any]]):
+        self._builders = builders
+        self._values: Dict[str, Any] = {}
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._values:
+            self._values[key] = self._builders[key]()
+        return self._values[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._builders)
+    
+    def __len__(self) -> int:
+        return len(self._builders)
+
+
 class CSVAnalyzer:
     """Analyzes incident statistics from CSV file"""
     
+    # Low-cardinality labels as categoricals: smaller and faster to group.
+    # Hours stay float64 so rounded averages don't pick up float32 error.
+    DTYPES = {
+        'month': 'category',
+        'incident_type': 'category',
+        'count': 'int32',
+        'avg_resolution_hours': 'float64',
+        'severity': 'category'
+    }
+    
     def __init__(self, csv_path: str = "data/incident_stats.csv"):
         """
         Initialize CSV analyzer
@@ -23,13 +55,28 @@ class CSVAnalyzer:
         """
         self.csv_path = Path(csv_path)
         self.df = None
+        self._display_names = {}
+        self._total = 0
+        self._avg_resolution = 0
+        self._by_type = pd.Series(dtype='int64')
+        self._by_severity = {}
+        self._monthly = pd.DataFrame()
+        self._search_cached = lru_cache(maxsize=256)(self._search_similar_incidents)
         self._load_data()
     
     def _load_data(self):
         """Load CSV data into pandas DataFrame"""
         try:
             if self.csv_path.exists():
-                self.df = pd.read_csv(self.csv_path)
+                # Only the columns the aggregates use; memory_map parses straight from the file
+                self.df = pd.read_csv(
+                    self.csv_path,
+                    usecols=list(self.DTYPES),
+                    dtype=self.DTYPES,
+                    memory_map=True
+                )
+                logger.debug(f"Incident DataFrame uses {self.df.memory_usage(deep=True).sum()} bytes")
+                self.invalidate()
                 logger.info(f"Loaded {len(self.df)} incident records from CSV")
             else:
                 logger.warning(f"CSV file not found: {self.csv_path}")
@@ -38,42 +85,91 @@ class CSVAnalyzer:
             logger.error(f"Error loading CSV: {e}")
             self.df = pd.DataFrame()
     
+    def invalidate(self):
+        """
+        Re-derive everything computed from self.df
+        
+        Called after loading; call it again whenever self.df is replaced or
+        modified so display names, aggregates and memoized searches follow.
+        """
+        self._search_cached.cache_clear()
+        self._prepare_frame()
+        self._compute_aggregates()
+    
+    def _prepare_frame(self):
+        """Normalize label columns and build the display-name map"""
+        self._display_names = {}
+        if self.df is None or self.df.empty:
+            return
+        
+        for column in ('month', 'incident_type', 'severity'):
+            if not isinstance(self.df[column].dtype, pd.CategoricalDtype):
+                self.df[column] = self.df[column].astype('category')
+        
+        # Order months chronologically rather than lexically ("2024-10" after "2024-9")
+        months = self.df['month'].cat.categories
+        chronological = pd.to_datetime(months, format='%Y-%m', errors='coerce').argsort()
+        self.df['month'] = self.df['month'].cat.reorder_categories(months[chronological], ordered=True)
+        
+        # Categories exclude blank cells, so every key is a real type name
+        self._display_names = {
+            incident_type: incident_type.replace('_', ' ').title()
+            for incident_type in self.df['incident_type'].cat.categories
+        }
+    
+    def _compute_aggregates(self):
+        """Precompute the aggregates served by the getters"""
+        if self.df is None or self.df.empty:
+            self._total = 0
+            self._avg_resolution = 0
+            self._by_type = pd.Series(dtype='int64')
+            self._by_severity = {}
+            self._monthly = pd.DataFrame()
+            return
+        
+        # Totals straight from the NumPy columns, over every row including
+        # rows without an incident_type (which the per-type groupby drops)
+        counts = self.df['count'].to_numpy()
+        hours = self.df['avg_resolution_hours'].to_numpy()
+        
+        total_count = counts.sum()
+        self._total = int(total_count)
+        
+        # Weighted average based on incident count (nansum skips blank hours like pandas does)
+        total_time = np.nansum(counts * hours)
+        self._avg_resolution = round(total_time / total_count, 2) if total_count > 0 else 0
+        
+        self._by_type = self.df.groupby('incident_type', observed=True)['count'].sum()
+        self._by_severity = self.df.groupby('severity', observed=True)['count'].sum().to_dict()
+        self._monthly = self.df.groupby('month', observed=True).agg({
+            'count': 'sum',
+            'avg_resolution_hours': 'mean'
+        }).round(2)
+    
+    def get_display_name(self, incident_type: str) -> str:
+        """Get the human-readable name for an incident type"""
+        name = self._display_names.get(incident_type)
+        return name if name is not None else incident_type.replace('_', ' ').title()
+    
     def get_total_incidents(self) -> int:
         """Get total number of incidents"""
-        if self.df is not None and not self.df.empty:
-            return int(self.df['count'].sum())
-        return 0
+        return self._total
     
     def get_incident_by_type(self) -> Dict[str, int]:
         """Get incident counts grouped by type"""
-        if self.df is not None and not self.df.empty:
-            return self.df.groupby('incident_type')['count'].sum().to_dict()
-        return {}
+        return self._by_type.to_dict()
     
     def get_avg_resolution_time(self) -> float:
         """Get average resolution time across all incidents"""
-        if self.df is not None and not self.df.empty:
-            # Weighted average based on incident count
-            total_time = (self.df['avg_resolution_hours'] * self.df['count']).sum()
-            total_count = self.df['count'].sum()
-            return round(total_time / total_count, 2) if total_count > 0 else 0
-        return 0
+        return self._avg_resolution
     
     def get_severity_distribution(self) -> Dict[str, int]:
         """Get incident counts by severity level"""
-        if self.df is not None and not self.df.empty:
-            return self.df.groupby('severity')['count'].sum().to_dict()
-        return {}
+        return dict(self._by_severity)
     
     def get_monthly_trends(self) -> pd.DataFrame:
         """Get monthly incident trends"""
-        if self.df is not None and not self.df.empty:
-            monthly = self.df.groupby('month').agg({
-                'count': 'sum',
-                'avg_resolution_hours': 'mean'
-            }).round(2)
-            return monthly
-        return pd.DataFrame()
+        return self._monthly.copy()
     
     def get_top_incidents(self, n: int = 3) -> List[Dict[str, Any]]:
         """
@@ -85,10 +181,8 @@ class CSVAnalyzer:
         Returns:
             List of dictionaries with incident type and count
         """
-        if self.df is not None and not self.df.empty:
-            top = self.df.groupby('incident_type')['count'].sum().nlargest(n)
-            return [{'type': idx, 'count': int(val)} for idx, val in top.items()]
-        return []
+        top = self._by_type.nlargest(n)
+        return [{'type': idx, 'count': int(val)} for idx, val in top.items()]
     
     def get_insights(self) -> List[str]:
         """
@@ -106,7 +200,7 @@ class CSVAnalyzer:
         top_incidents = self.get_top_incidents(1)
         if top_incidents:
             insights.append(
-                f"🔴 Most common incident: **{top_incidents[0]['type'].replace('_', ' ').title()}** "
+                f"🔴 Most common incident: **{self.get_display_name(top_incidents[0]['type'])}** "
                 f"({top_incidents[0]['count']} occurrences)"
             )
         
@@ -124,8 +218,8 @@ class CSVAnalyzer:
             if high_count > 0:
                 insights.append(f"🟠 High severity incidents: **{high_count}**")
         
-        # Monthly trend
-        monthly = self.get_monthly_trends()
+        # Monthly trend (cached frame is in chronological order; read-only here)
+        monthly = self._monthly
         if not monthly.empty and len(monthly) >= 2:
             last_month = monthly.iloc[-1]['count']
             prev_month = monthly.iloc[-2]['count']
@@ -140,22 +234,25 @@ class CSVAnalyzer:
         
         return insights
     
-    def get_chart_data(self) -> Dict[str, Any]:
+    def get_chart_data(self) -> Mapping[str, Any]:
         """
         Get data formatted for charts
         
+        Entries are built on first access, so callers only pay for the
+        charts they render.
+        
         Returns:
-            Dictionary with chart data
+            Mapping with chart data
         """
         if self.df is None or self.df.empty:
             return {}
         
-        return {
-            'incident_by_type': self.get_incident_by_type(),
-            'severity_distribution': self.get_severity_distribution(),
-            'monthly_trends': self.get_monthly_trends().to_dict(),
-            'top_incidents': self.get_top_incidents(5)
-        }
+        return _LazyChartData({
+            'incident_by_type': self.get_incident_by_type,
+            'severity_distribution': self.get_severity_distribution,
+            'monthly_trends': lambda: self.get_monthly_trends().to_dict(),
+            'top_incidents': lambda: self.get_top_incidents(5)
+        })
     
     def search_similar_incidents(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -167,26 +264,41 @@ class CSVAnalyzer:
         Returns:
             List of matching incident types with statistics
         """
+        # Results are memoized per normalized query; return a copy of the list
+        return list(self._search_cached(" ".join(query.lower().split())))
+    
+    def _search_similar_incidents(self, query_lower: str) -> List[Dict[str, Any]]:
+        """Uncached search over incident types for a normalized query"""
         if self.df is None or self.df.empty:
             return []
         
-        query_lower = query.lower()
-        results = []
+        words = query_lower.split()
+        if not words:
+            return []
         
-        # Search in incident types
-        for incident_type in self.df['incident_type'].unique():
-            if any(word in incident_type for word in query_lower.split()):
-                type_data = self.df[self.df['incident_type'] == incident_type]
-                total_count = int(type_data['count'].sum())
-                avg_time = round(type_data['avg_resolution_hours'].mean(), 2)
-                severity = type_data['severity'].mode()[0] if not type_data.empty else 'unknown'
-                
-                results.append({
-                    'incident_type': incident_type,
-                    'total_occurrences': total_count,
-                    'avg_resolution_hours': avg_time,
-                    'severity': severity,
-                    'insight': f"This incident has occurred {total_count} times with an average resolution time of {avg_time} hours."
-                })
+        # One vectorized substring match over all rows, then one grouped pass for the stats
+        pattern = '|'.join(map(re.escape, words))
+        matched = self.df[self.df['incident_type'].str.contains(pattern, regex=True, na=False)]
+        if matched.empty:
+            return []
+        
+        stats = matched.groupby('incident_type', observed=True, sort=False).agg(
+            total_occurrences=('count', 'sum'),
+            avg_resolution_hours=('avg_resolution_hours', 'mean'),
+            severity=('severity', lambda s: s.value_counts().idxmax())
+        )
+        
+        results = []
+        for incident_type, total_count, avg_time, severity in stats.itertuples():
+            total_count = int(total_count)
+            avg_time = round(avg_time, 2)
+            results.append({
+                'incident_type': incident_type,
+                'display_name': self.get_display_name(incident_type),
+                'total_occurrences': total_count,
+                'avg_resolution_hours': avg_time,
+                'severity': severity,
+                'insight': f"This incident has occurred {total_count} times with an average resolution time of {avg_time} hours."
+            })
         
         return results
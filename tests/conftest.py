@@ -0,0 +1,96 @@
+"""
+Shared pytest fixtures for the external data tests
+GitHub Status calls are mocked unless --integration is given
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Add src to path
+sys.path.insert(0, str(ROOT))
+
+from src.data_sources.csv_analyzer import CSVAnalyzer
+from src.data_sources.api_integrations import GitHubStatusAPI
+
+GITHUB_FIXTURES = {
+    'status.json': {
+        'status': {'indicator': 'none', 'description': 'All Systems Operational'}
+    },
+    'components.json': {
+        'components': [
+            {'name': 'API Requests', 'status': 'operational', 'description': '', 'updated_at': '2024-04-01T00:00:00Z'}
+        ]
+    },
+    'incidents.json': {
+        'incidents': [
+            {'name': f'Incident {i}', 'status': 'resolved', 'impact': 'minor',
+             'created_at': '2024-04-01T00:00:00Z', 'shortlink': f'https://stspg.io/{i}'}
+            for i in range(5)
+        ]
+    }
+}
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--integration",
+        action="store_true",
+        default=False,
+        help="run tests that call live external APIs"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "integration: calls live external APIs (opt in with --integration)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--integration"):
+        return
+    skip = pytest.mark.skip(reason="needs --integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def csv_analyzer():
+    """One analyzer (and one CSV parse) shared by the whole session"""
+    return CSVAnalyzer(ROOT / "data" / "incident_stats.csv")
+
+
+@pytest.fixture
+def github_requests(monkeypatch):
+    """Serve GitHub Status endpoints from GITHUB_FIXTURES; returns the list of requested URLs"""
+    calls = []
+
+    def fake_get(self, url, **kwargs):
+        calls.append(url)
+        return _FakeResponse(GITHUB_FIXTURES[url.rsplit('/', 1)[-1]])
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    return calls
+
+
+@pytest.fixture
+def github(github_requests):
+    """GitHubStatusAPI backed by the mocked endpoints"""
+    return GitHubStatusAPI()
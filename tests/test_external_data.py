@@ -0,0 +1,164 @@
+"""
+Tests for External Data Integration
+Run with: pytest tests/ (add --integration to hit the live GitHub Status API)
+"""
+
+import pandas as pd
+import pytest
+import requests
+
+from src.data_sources.api_integrations import GitHubStatusAPI
+from src.data_sources.csv_analyzer import CSVAnalyzer
+
+CSV_HEADER = "month,incident_type,count,avg_resolution_hours,severity,status\n"
+
+
+def write_csv(path, rows):
+    path.write_text(CSV_HEADER + "".join(f"{row}\n" for row in rows))
+    return path
+
+
+# CSV Analyzer
+
+def test_csv_analyzer_loads(csv_analyzer):
+    assert csv_analyzer.get_total_incidents() == 136
+    assert csv_analyzer.get_avg_resolution_time() > 0
+    assert len(csv_analyzer.get_insights()) >= 3
+
+
+def test_csv_incident_breakdowns(csv_analyzer):
+    by_type = csv_analyzer.get_incident_by_type()
+    assert sum(by_type.values()) == csv_analyzer.get_total_incidents()
+    assert sum(csv_analyzer.get_severity_distribution().values()) == csv_analyzer.get_total_incidents()
+
+    top = csv_analyzer.get_top_incidents(1)
+    assert top[0]['count'] == max(by_type.values())
+
+
+def test_csv_monthly_trends_are_chronological(tmp_path):
+    # Non-zero-padded months sort differently lexically ("2024-10" < "2024-9")
+    analyzer = CSVAnalyzer(write_csv(tmp_path / "stats.csv", [
+        "2024-10,disk_space,30,1.0,high,resolved",
+        "2024-9,disk_space,10,1.0,high,resolved",
+        "2024-10,auth_failure,5,2.0,critical,resolved",
+    ]))
+
+    assert list(analyzer.get_monthly_trends().index) == ['2024-9', '2024-10']
+    assert analyzer.get_insights()[-1] == "📈 Incidents increased by **250.0%** last month"
+
+
+def test_csv_chart_data(csv_analyzer):
+    chart_data = csv_analyzer.get_chart_data()
+    assert set(chart_data) == {'incident_by_type', 'severity_distribution', 'monthly_trends', 'top_incidents'}
+    assert chart_data['incident_by_type'] == csv_analyzer.get_incident_by_type()
+
+
+def test_csv_search_similar_incidents(csv_analyzer):
+    results = csv_analyzer.search_similar_incidents("database")
+    assert [r['incident_type'] for r in results] == ['database_timeout']
+    assert results[0]['display_name'] == 'Database Timeout'
+    assert results[0]['total_occurrences'] > 0
+
+    assert csv_analyzer.search_similar_incidents("") == []
+    assert csv_analyzer.search_similar_incidents("zzz") == []
+
+
+def test_csv_missing_file(tmp_path):
+    analyzer = CSVAnalyzer(tmp_path / "missing.csv")
+    assert analyzer.get_total_incidents() == 0
+    assert analyzer.get_insights() == ["No incident data available"]
+    assert analyzer.search_similar_incidents("database") == []
+
+
+def test_csv_blank_incident_type(tmp_path):
+    csv_path = write_csv(tmp_path / "stats.csv", [
+        "2024-01,disk_space,10,1.0,high,resolved",
+        "2024-01,,3,2.0,medium,resolved",
+        "2024-02,auth_failure,4,2.0,critical,resolved",
+    ])
+    analyzer = CSVAnalyzer(csv_path)
+
+    assert analyzer.get_incident_by_type() == {'auth_failure': 4, 'disk_space': 10}
+    assert analyzer.get_total_incidents() == 17
+    assert analyzer.get_avg_resolution_time() == round((10 * 1.0 + 3 * 2.0 + 4 * 2.0) / 17, 2)
+    assert analyzer.get_insights()[0].startswith("🔴 Most common incident: **Disk Space**")
+    assert analyzer.search_similar_incidents("disk")[0]['display_name'] == 'Disk Space'
+
+
+def test_csv_invalidate_after_replacing_data(tmp_path):
+    analyzer = CSVAnalyzer(write_csv(tmp_path / "stats.csv", [
+        "2024-01,auth_failure,4,2.0,critical,resolved",
+    ]))
+    assert analyzer.search_similar_incidents("disk") == []
+
+    analyzer.df = pd.DataFrame({
+        'month': ['2024-10', '2024-9'],
+        'incident_type': ['disk_space', 'disk_space'],
+        'count': [6, 2],
+        'avg_resolution_hours': [3.0, 1.0],
+        'severity': ['medium', 'medium'],
+    })
+    analyzer.invalidate()
+
+    results = analyzer.search_similar_incidents("disk")
+    assert [r['display_name'] for r in results] == ['Disk Space']
+    assert results[0]['total_occurrences'] == 8
+    assert analyzer.get_total_incidents() == 8
+    assert list(analyzer.get_monthly_trends().index) == ['2024-9', '2024-10']
+
+    analyzer.df = pd.DataFrame()
+    analyzer.invalidate()
+    assert analyzer.get_total_incidents() == 0
+    assert analyzer.get_incident_by_type() == {}
+
+
+# GitHub Status API
+
+def test_github_status(github):
+    status = github.get_status()
+    assert status['is_operational'] is True
+    assert github.get_summary().startswith("✅")
+    assert github.is_github_down() is False
+
+
+def test_github_components_and_incidents(github):
+    assert github.get_components()['API Requests']['status'] == 'operational'
+    assert len(github.get_recent_incidents(3)) == 3
+
+
+def test_github_responses_are_cached(github, github_requests):
+    for _ in range(3):
+        github.get_status()
+        github.get_components()
+        github.get_recent_incidents()
+    assert len(github_requests) == 3
+
+    github.clear_cache()
+    github.get_status()
+    assert len(github_requests) == 4
+
+
+def test_github_unreachable(monkeypatch):
+    def fail(self, url, **kwargs):
+        raise requests.exceptions.ConnectionError("offline")
+
+    monkeypatch.setattr(requests.Session, "get", fail)
+    github = GitHubStatusAPI()
+
+    assert github.get_status()['status'] == 'error'
+    assert github.get_summary() == "⚠️ Unable to check GitHub status"
+    assert github.get_components() == {}
+    assert github.get_recent_incidents() == []
+
+
+@pytest.mark.integration
+def test_github_live():
+    status = GitHubStatusAPI().get_status()
+    assert status['status'] != 'error', status.get('error')
+
+
+# Data Integration
+
+def test_data_integration(csv_analyzer, github):
+    assert len(csv_analyzer.get_incident_by_type()) == 3
+    assert github.is_github_down() is False